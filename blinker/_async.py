@@ -8,19 +8,56 @@ try:  # for Python3.7+
 except AttributeError:  # for versions prior to Python3.7
     create_task = asyncio.ensure_future
 
+try:  # for Python3.7+
+    get_running_loop = asyncio.get_running_loop
+except AttributeError:  # for versions prior to Python3.7
+    get_running_loop = asyncio.get_event_loop
+
+
+def _resolved_future(value):
+    """Wrap a plain 'value' in an already-resolved future"""
+    fut = get_running_loop().create_future()
+    fut.set_result(value)
+    return fut
+
 
-async def _wrap_plain_value(value):
-    """Pass through a coroutine 'value' or wrap a plain value"""
-    if asyncio.iscoroutine(value):
-        value = await value
-    return value
+def isend_async(self, *sender, **kwargs):
+    _iscoro = asyncio.iscoroutine
+    _task = create_task
+    for receiver, value in self.send(*sender, **kwargs):
+        if _iscoro(value):
+            yield receiver, _task(value)
+        else:
+            # plain values are presented as already-resolved futures rather
+            # than being scheduled as a task
+            yield receiver, _resolved_future(value)
 
 
 def send_async(self, *sender, **kwargs):
-    return [(receiver, create_task(_wrap_plain_value(value)))
+    _iscoro = asyncio.iscoroutine
+    _task = create_task
+    return [(receiver,
+             _task(value) if _iscoro(value) else _resolved_future(value))
             for receiver, value
             in self.send(*sender, **kwargs)]
 
 
-send_async.__doc__ = Signal.send_async.__doc__
-Signal.send_async = send_async
+def send_async_gather(self, *sender, **kwargs):
+    receivers = []
+    awaitables = []
+    _iscoro = asyncio.iscoroutine
+    for receiver, value in self.send(*sender, **kwargs):
+        receivers.append(receiver)
+        if not _iscoro(value):
+            value = _resolved_future(value)
+        awaitables.append(value)
+    return receivers, asyncio.gather(*awaitables)
+
+
+# install the implementations on Signal as ordinary methods; they also
+# remain importable from this module for calling as plain functions
+for _method in (isend_async, send_async, send_async_gather):
+    _method.__doc__ = getattr(Signal, _method.__name__).__doc__
+    _method.__qualname__ = 'Signal.' + _method.__name__
+    setattr(Signal, _method.__name__, _method)
+del _method
@@ -33,11 +33,26 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #
 
-import sys
-import traceback
 import weakref
 
 
+weakref_ref = weakref.ref
+
+# multiplier for instance keys (2**64 / golden ratio, above 2**63).  With
+# ids below 2**63, XOR-ing id_func only touches bits under 63, so two keys
+# (id_self * _KEY_MIX) ^ id_func can only match if their products agree on
+# every higher bit, i.e. differ by less than 2**63 < _KEY_MIX.  That forces
+# equal id_self, and then equal id_func: the key is unique per pair.
+_KEY_MIX = 0x9E3779B97F4A7C15
+
+# annotations that may be attached to a BoundMethodWeakref; they are stored
+# in slots, so no other attribute names can be set on an instance
+REFERENCE_ANNOTATIONS = ('receiver_id', 'sender_id')
+
+# sentinel for attribute probes, where None is a legitimate value
+_MISSING = object()
+
+
 def safe_ref(target, on_delete=None):
     """wraps a *safe* reference in a weakref
     target: the object to be wrapped in a weak reference
@@ -46,40 +61,54 @@ def safe_ref(target, on_delete=None):
     """
 
     # if 'target' is a bound method, wrap it in a BoundMethodWeakref
-    if hasattr(target, '__self__'):
-        if not hasattr(target, '__func__'):
+    if getattr(target, '__self__', _MISSING) is not _MISSING:
+        if getattr(target, '__func__', _MISSING) is _MISSING:
             raise TypeError(f'Target {target} is bound but not a method')
         return BoundMethodWeakref(target, on_delete)
 
     # if on_delete was specified, pass it to weakref.ref too
-    if on_delete:
+    if on_delete is not None:
         if not callable(on_delete):
             raise TypeError("Keyword argument 'on_delete' must be callable")
-        return weakref.ref(target, on_delete)
+        return weakref_ref(target, on_delete)
 
-    return weakref.ref(target)
+    return weakref_ref(target)
 
 
 class BoundMethodWeakref:
     """'Safe' and reusable weak references to instance methods"""
 
-    # repository of all instantiated BoundMethodWeakrefs
+    # REFERENCE_ANNOTATIONS are the attributes that
+    # blinker._utilities.reference() may attach
+    __slots__ = ('cleanup_methods', 'key', 'weak_self', 'weak_func',
+                 '__weakref__') + REFERENCE_ANNOTATIONS
+
+    # repository of all instantiated BoundMethodWeakrefs; held weakly so
+    # that a reference dropped before its target dies (e.g. on disconnect)
+    # does not keep its cleanup methods alive
     _all_instances = weakref.WeakValueDictionary()
 
     def __new__(cls, target, on_delete=None):
         """interrupts normal object creation process to add the instance to _all_instances"""
 
-        instance_hash = cls.get_instance_key(target)
+        instance_key = cls.get_instance_key(target)
 
         # if 'target' is already in _all_instances, add the 'on_delete' cleanup if specified
-        if instance_hash in cls._all_instances:
-            existing_obj = cls._all_instances[instance_hash]
-            if on_delete:
-                existing_obj.cleanup_methods.append(on_delete)
-            return cls._all_instances[instance_hash]
+        existing_obj = cls._all_instances.get(instance_key)
+        if existing_obj is not None:
+            if on_delete is not None:
+                current = existing_obj.cleanup_methods
+                if current is None:
+                    existing_obj.cleanup_methods = on_delete
+                elif isinstance(current, list):
+                    current.append(on_delete)
+                else:
+                    existing_obj.cleanup_methods = [current, on_delete]
+            return existing_obj
 
         obj = super().__new__(cls)
-        cls._all_instances[instance_hash] = obj
+        obj.key = instance_key
+        cls._all_instances[instance_key] = obj
         return obj
 
     def __init__(self, target, on_delete=None):
@@ -94,41 +123,49 @@ class BoundMethodWeakref:
           object or the function is garbage collected); should take a single
           argument
         """
-        self.cleanup_methods = [on_delete] if on_delete else []
-        self.key = self.get_instance_key(target)
+        if hasattr(self, 'weak_self'):
+            # an existing instance was handed back by __new__; it is
+            # already fully initialised
+            return
 
-        self.weak_self = weakref.ref(target.__self__, self._remove)
-        self.weak_func = weakref.ref(target.__func__, self._remove)
+        # None, a single callback, or a list once a second one is added
+        self.cleanup_methods = on_delete
 
-        self.self_name = str(target.__self__)
-        self.func_name = str(target.__func__)
+        # _remove is idempotent, so it is safe for both callbacks to fire
+        self.weak_self = weakref_ref(target.__self__, self._remove)
+        self.weak_func = weakref_ref(target.__func__, self._remove)
 
-    def _remove(self, weak):
+    def _remove(self, weak, _instances=_all_instances):
         """delete all references to both the object's owner (__self__)
            and the method instance (__func__)"""
 
         # remove the instance from BoundMethodWeakref._all_instances
-        del self.__class__._all_instances[self.key]
-
-        # run all the cleanup methods in self.cleanup_methods
-        for cleanup_method in self.cleanup_methods:
+        _instances.pop(self.key, None)
+
+        # detach the cleanup methods first so that a repeated call is a no-op
+        cleanup_methods, self.cleanup_methods = self.cleanup_methods, None
+
+        # run all the cleanup methods that were registered
+        if cleanup_methods is None:
+            return
+        if not isinstance(cleanup_methods, list):
+            cleanup_methods(self)
+            return
+        for cleanup_method in cleanup_methods:
             cleanup_method(self)
 
-        # remove all references to the BoundMethodWeakref's cleanup methods
-        del self.cleanup_methods
-
     @staticmethod
     def get_instance_key(target):
         """calculates the reference key for the given target"""
-        return hash((id(target.__self__), id(target.__func__)))
+        return (id(target.__self__) * _KEY_MIX) ^ id(target.__func__)
 
     def __repr__(self):
-        return f'{self.__class__.__name__}({self.self_name}.{self.func_name})'
-
-    def __cmp__(self, other):
-        if not isinstance(other, self.__class__):
-            return cmp(self.__class__, type(other))
-        return cmp(self.key, other.key)
+        # names are resolved here rather than at construction, since str()
+        # of an arbitrary owner object may be expensive
+        owner = self.weak_self()
+        function = self.weak_func()
+        func_name = getattr(function, '__name__', function)
+        return f'{self.__class__.__name__}({owner}.{func_name})'
 
     def __call__(self):
         """Returns a strong reference (specifically, a bound instance method)
@@ -136,9 +173,14 @@ class BoundMethodWeakref:
 
         NOTE:
         This method may be called any number of times, as it does
-        not invalidate the reference
+        not invalidate the reference. Returns None once either the object
+        or the function has been garbage collected
         """
 
         target = self.weak_self()
+        if target is None:
+            return None
         function = self.weak_func()
+        if function is None:
+            return None
         return function.__get__(target)
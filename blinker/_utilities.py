@@ -1,6 +1,6 @@
 from weakref import ref
 
-from blinker._saferef import BoundMethodWeakref
+from blinker._saferef import REFERENCE_ANNOTATIONS, BoundMethodWeakref
 
 
 try:
@@ -119,7 +119,15 @@ class annotatable_weakref(ref):
 
 
 def reference(object, callback=None, **annotations):
-    """Return an annotated weak ref."""
+    """Return an annotated weak ref.
+
+    Only the annotation names in REFERENCE_ANNOTATIONS (``receiver_id`` and
+    ``sender_id``) are supported, as bound method references keep their
+    annotations in slots.
+    """
+    for key in annotations:
+        if key not in REFERENCE_ANNOTATIONS:
+            raise TypeError('unsupported reference annotation %r' % key)
     if callable(object):
         weak = callable_reference(object, callback)
     else:
@@ -282,6 +282,40 @@ class Signal(object):
         """
         raise NotImplementedError("asyncio support unavailable")
 
+    def isend_async(self, *sender, **kwargs):
+        """Iterate over results from connected functions and coroutines.
+
+        As :meth:`send_async`, but yields the ``(receiver, future)`` pairs
+        one at a time instead of collecting them into a list.  All
+        receivers are called when iteration begins; coroutines are then
+        scheduled as the iterator is consumed.
+
+        The iterator must be consumed completely: coroutines from receivers
+        that are never reached are not scheduled at all.  Awaiting each
+        future inside the loop also runs coroutine receivers one after
+        another rather than concurrently; collect the futures first, as
+        :meth:`send_async` does, to run them together.
+
+        Available only if asyncio and `yield from` are present.
+
+        .. versionadded:: 1.5
+        """
+        raise NotImplementedError("asyncio support unavailable")
+
+    def send_async_gather(self, *sender, **kwargs):
+        """Send to connected functions and coroutines, gathering the results.
+
+        As :meth:`send_async`, but returns a 2-tuple of the list of
+        receivers and a single :func:`asyncio.gather` future that resolves
+        to their return values, in the same order.  Prefer this over
+        :meth:`send_async` when all results are awaited together.
+
+        Available only if asyncio and `yield from` are present.
+
+        .. versionadded:: 1.5
+        """
+        raise NotImplementedError("asyncio support unavailable")
+
     def has_receivers_for(self, sender):
         """True if there is probably a receiver for *sender*.
 
@@ -42,4 +42,84 @@ def test_send_async():
     collected_results = {v.result() for r, v in results}
     assert collected_results == set(expected.values())
 
+
+def test_send_async_gather():
+    async def receiver_a(sender):
+        return 'value a'
+
+    def receiver_b(sender):
+        return 'value b'
+
+    sig = blinker.Signal()
+    sig.connect(receiver_a)
+    sig.connect(receiver_b)
+
+    async def collect():
+        receivers, gathered = sig.send_async_gather()
+        return receivers, await gathered
+
+    loop = asyncio.get_event_loop()
+    receivers, values = loop.run_until_complete(collect())
+
+    expected = {
+        receiver_a: 'value a',
+        receiver_b: 'value b',
+        }
+
+    assert dict(zip(receivers, values)) == expected
+
+
+def test_isend_async():
+    async def receiver_a(sender):
+        return 'value a'
+
+    def receiver_b(sender):
+        return 'value b'
+
+    sig = blinker.Signal()
+    sig.connect(receiver_a)
+    sig.connect(receiver_b)
+
+    async def collect():
+        return {receiver: await future
+                for receiver, future in sig.isend_async()}
+
+    loop = asyncio.get_event_loop()
+    results = loop.run_until_complete(collect())
+
+    assert results == {
+        receiver_a: 'value a',
+        receiver_b: 'value b',
+        }
+
+
+def test_send_async_requires_running_loop():
+    if not hasattr(asyncio, 'get_running_loop'):
+        # before Python 3.7 the loop is looked up with get_event_loop(),
+        # which hands back an idle loop instead of raising
+        return
+
+    def receiver(sender):
+        return 'value'
+
+    sig = blinker.Signal()
+    sig.connect(receiver)
+
+    try:
+        sig.send_async()
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError('send_async ran without an event loop')
+
+
+def test_send_async_without_receivers():
+    sig = blinker.Signal()
+
+    assert sig.send_async() == []
+
 test_send_async()
+test_send_async_gather()
+test_isend_async()
+test_send_async_requires_running_loop()
+test_send_async_without_receivers()
@@ -32,6 +32,7 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #
+import types
 import unittest
 
 import sys, os.path
@@ -114,6 +115,41 @@ class TestSaferef(unittest.TestCase):
         """
         repr(self.ss[-1])
 
+    def test_ReuseKeepsCleanup(self):
+        """Test that reusing a reference keeps earlier cleanup callbacks"""
+        t = _Sample1()
+        s = safe_ref(t.x, self._closure)
+        assert safe_ref(t.x, self._closure) is s
+        del t
+        assert self.closure_count == 2
+
+    def test_RemoveIsIdempotent(self):
+        """Test that cleanup callbacks run only once"""
+        t = _Sample1()
+        s = safe_ref(t.x, self._closure)
+        s._remove(None)
+        s._remove(None)
+        assert self.closure_count == 1
+
+    def test_DeadReference(self):
+        """Test that a reference to a collected owner returns None"""
+        t = _Sample1()
+        s = safe_ref(t.x)
+        del t
+        assert s() is None
+
+    def test_FunctionDiesFirst(self):
+        """Test that a reference is cleaned up when its function dies"""
+        t = _Sample1()
+        f = lambda self: None
+        s = safe_ref(types.MethodType(f, t), self._closure)
+        del f
+        assert self.closure_count == 1
+        assert s() is None
+
+        g = lambda self: None
+        assert safe_ref(types.MethodType(g, t))() is not None
+
     def _closure(self, ref):
         """Dumb utility mechanism to increment deletion counter"""
         self.closure_count += 1
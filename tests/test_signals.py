@@ -1,6 +1,7 @@
 import gc
 import sys
 import time
+import weakref
 
 import sys, os.path
 parent_dir = os.path.dirname(os.path.dirname(__file__))
@@ -14,7 +15,13 @@ jython = sys.platform.startswith('java')
 pypy = hasattr(sys, 'pypy_version_info')
 
 try:
-    from _test_async import test_send_async
+    from _test_async import (
+        test_send_async,
+        test_send_async_gather,
+        test_send_async_requires_running_loop,
+        test_send_async_without_receivers,
+        test_isend_async,
+        )
 except (SyntaxError, ImportError):
     pass
 
@@ -345,6 +352,24 @@ def test_instancemethod_receiver():
     assert len(sentinel) == 1
 
 
+def test_instancemethod_receiver_disconnect_releases_signal():
+    class Receiver(object):
+        def received(self, sender):
+            pass
+
+    receiver = Receiver()
+    signal_refs = []
+    for _ in range(10):
+        sig = blinker.Signal()
+        sig.connect(receiver.received)
+        sig.disconnect(receiver.received)
+        signal_refs.append(weakref.ref(sig))
+        del sig
+    gc.collect()
+
+    assert [ref for ref in signal_refs if ref() is not None] == []
+
+
 def test_filtered_receiver():
     sentinel = []
     def received(sender):
@@ -3,7 +3,9 @@ import pickle
 import sys, os.path
 parent_dir = os.path.dirname(os.path.dirname(__file__))
 sys.path.insert(0, parent_dir)
-from blinker._utilities import symbol
+from blinker._utilities import reference, symbol
+
+from pytest import raises
 
 
 def test_symbols():
@@ -25,3 +27,16 @@ def test_pickled_symbols():
     for protocol in 0, 1, 2:
         roundtrip = pickle.loads(pickle.dumps(foo))
         assert roundtrip is foo
+
+
+def test_reference_annotations():
+    class Receiver(object):
+        def received(self, sender):
+            pass
+
+    receiver = Receiver()
+    weak = reference(receiver.received, receiver_id=1)
+    assert weak.receiver_id == 1
+
+    with raises(TypeError):
+        reference(receiver.received, foo=1)